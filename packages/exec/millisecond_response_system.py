@@ -10,17 +10,30 @@ fill→repost事件优先级（毫秒级）+ TTL撤换
 """
 
 import time
+import bisect
+import heapq
+import random
 import asyncio
 import logging
 from decimal import Decimal
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple, Deque
 from enum import Enum
-import statistics
 from collections import deque
 
 logger = logging.getLogger(__name__)
 
+# TTL预采样表大小 (2的幂，用位与取模循环)
+_TTL_TABLE_SIZE = 4096
+_TTL_TABLE_MASK = _TTL_TABLE_SIZE - 1
+
+# 每个微批最多处理的事件数 (按当前事件优先级封顶，下标 = EventPriority.value - 1)
+# 成交突发时一个批次内排空，低优先级的新建订单则保持小批量以便让出循环
+_BATCH_MAX = (32, 16, 8, 4)
+
+# 指标采样窗口 (只保留最近N个样本，防止全天运行内存无界增长)
+_METRICS_WINDOW = 10000
+
 
 class EventPriority(Enum):
     FILL = 1         # 最高优先级：成交响应
@@ -35,20 +48,26 @@ class OrderLevel(Enum):
     L2 = "L2"        # 深度层级
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class PriorityEvent:
     """优先级事件"""
     priority: EventPriority
     event_type: str
     order_id: str
     data: Dict[str, Any]
-    timestamp: float
+    timestamp: int           # time.monotonic_ns()
     callback: Optional[Callable] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TTLConfig:
-    """TTL配置"""
+    """
+    TTL配置 (不可变)
+    
+    各级TTL在配置变更时一次性预采样成表，下单时只做查表；
+    因此字段不可直接赋值 (会抛FrozenInstanceError)，修改请构造新的TTLConfig
+    并调用 MillisecondResponseSystem.set_ttl_config，由其重建预采样表。
+    """
     l0_min: float = 1.8      # L0最小TTL (秒)
     l0_max: float = 2.5      # L0最大TTL (秒)
     l1_ttl: float = 8.0      # L1 TTL (秒)
@@ -57,75 +76,97 @@ class TTLConfig:
     jitter_max: float = 1.0  # 抖动最大值 (秒)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseMetrics:
     """响应指标"""
-    fill_to_repost_times: List[float]     # Fill到Repost延迟
-    event_queue_sizes: List[int]          # 事件队列大小
+    fill_to_repost_times: Deque[float]    # Fill到Repost延迟 (最近N个)
+    event_queue_sizes: Deque[int]         # 事件队列大小 (最近N个)
     ttl_violations: int                   # TTL违规次数
-    priority_inversions: int              # 优先级倒置次数
-    micro_batch_intervals: List[float]    # 微批间隔
+    priority_inversions: int              # 低优先级回调执行期间有FILL到达而等待的次数
+    micro_batch_intervals: Deque[float]   # 微批间隔 (最近N个)
 
 
 class MillisecondResponseSystem:
     """毫秒响应系统核心"""
     
     def __init__(self):
-        # 优先级队列 (按优先级排序)
-        self.priority_queue: List[PriorityEvent] = []
+        # 优先级队列: 每个优先级一个FIFO队列(deque)，按 FILL > CANCEL > REPLACE > CREATE 顺序出队
+        # 下标 = EventPriority.value - 1，入队/出队均为O(1)
+        self.priority_queues: List[deque] = [deque() for _ in EventPriority]
+        self.queued_events = 0
+        self.queue_depth_max: List[int] = [0] * len(EventPriority)  # 各优先级历史最大深度(背压指标)
+        # 新事件到达时唤醒空闲的处理循环；在start()中于运行中的事件循环内创建，
+        # 实例跨asyncio.run复用时不会绑定到已关闭的旧循环
+        self._wakeup: Optional[asyncio.Event] = None
         
         # TTL配置与跟踪
         self.ttl_config = TTLConfig()
-        self.active_orders: Dict[str, Dict] = {}  # order_id -> {ttl, created_time, level}
+        self._ttl_cursor = 0
+        self._build_ttl_tables()
+        self.active_orders: Dict[str, Dict] = {}  # order_id -> {ttl, created_time(ns), expire_time(ns), level}
+        self._ttl_heap: List[Tuple[int, str]] = []  # (expire_time, order_id) 到期最小堆
         
         # 微批节奏控制
         self.micro_batch_interval = 0.035  # 35ms默认间隔
-        self.last_batch_time = 0.0
+        self.last_batch_time = 0  # time.monotonic_ns()
         
         # 性能指标
         self.metrics = ResponseMetrics(
-            fill_to_repost_times=[],
-            event_queue_sizes=[],
+            fill_to_repost_times=deque(maxlen=_METRICS_WINDOW),
+            event_queue_sizes=deque(maxlen=_METRICS_WINDOW),
             ttl_violations=0,
             priority_inversions=0,
-            micro_batch_intervals=[]
+            micro_batch_intervals=deque(maxlen=_METRICS_WINDOW)
         )
+        # 与fill_to_repost_times同窗口的有序副本，百分位读取无需再排序
+        self._sorted_fill_times: List[float] = []
         
         # 系统状态
         self.running = False
         self.fill_events_count = 0
         self.repost_success_count = 0
         
+        # 日志级别开关缓存：热路径上关闭的日志连调用都省掉
+        self.refresh_log_flags()
+        
         logger.info("[MillisecondResponse] 毫秒响应系统初始化完成")
     
+    def refresh_log_flags(self):
+        """重新读取日志级别 (调整logging配置后调用)"""
+        self._log_debug = logger.isEnabledFor(logging.DEBUG)
+        self._log_info = logger.isEnabledFor(logging.INFO)
+    
     def add_priority_event(self, event: PriorityEvent):
         """添加优先级事件到队列"""
-        # 按优先级插入（维持排序）
-        inserted = False
-        for i, existing_event in enumerate(self.priority_queue):
-            if event.priority.value < existing_event.priority.value:
-                self.priority_queue.insert(i, event)
-                inserted = True
-                break
+        # 追加到对应优先级队列 O(1)；按优先级顺序出队，不会发生优先级倒置
+        idx = event.priority.value - 1
+        queue = self.priority_queues[idx]
+        queue.append(event)
+        self.queued_events += 1
         
-        if not inserted:
-            self.priority_queue.append(event)
+        if len(queue) > self.queue_depth_max[idx]:
+            self.queue_depth_max[idx] = len(queue)
         
-        # 记录队列大小指标
-        self.metrics.event_queue_sizes.append(len(self.priority_queue))
+        if self._wakeup is not None:
+            self._wakeup.set()
         
-        # 检测优先级倒置
-        if len(self.priority_queue) > 1 and event.priority != EventPriority.FILL:
-            if any(e.priority == EventPriority.FILL for e in self.priority_queue[1:]):
-                self.metrics.priority_inversions += 1
-                logger.warning(
-                    "[MillisecondResponse] 检测到优先级倒置: %s在FILL前执行",
-                    event.event_type
-                )
+        # 记录队列大小指标
+        self.metrics.event_queue_sizes.append(self.queued_events)
+    
+    def _pop_priority_event(self) -> Optional[PriorityEvent]:
+        """按优先级取出下一个事件，队列为空时返回None"""
+        if not self.queued_events:
+            return None
+        for queue in self.priority_queues:
+            if queue:
+                self.queued_events -= 1
+                return queue.popleft()
+        return None
     
     def register_fill_event(self, order_id: str, fill_price: Decimal, 
                            fill_qty: Decimal, side: str, callback: Callable):
         """注册成交事件 - 最高优先级"""
+        ts = time.monotonic_ns()
         fill_event = PriorityEvent(
             priority=EventPriority.FILL,
             event_type="FILL",
@@ -134,41 +175,45 @@ class MillisecondResponseSystem:
                 'price': fill_price,
                 'qty': fill_qty,
                 'side': side,
-                'timestamp': time.time()
+                'timestamp': ts
             },
-            timestamp=time.time(),
+            timestamp=ts,
             callback=callback
         )
         
         self.add_priority_event(fill_event)
         self.fill_events_count += 1
         
-        logger.debug(
-            "[MillisecondResponse] 🔥 FILL事件注册: %s %s@%s (优先级=1)",
-            order_id, fill_qty, fill_price
-        )
+        if self._log_debug:
+            logger.debug(
+                "[MillisecondResponse] 🔥 FILL事件注册: %s %s@%s (优先级=1)",
+                order_id, fill_qty, fill_price
+            )
     
     def register_cancel_event(self, order_id: str, callback: Callable):
         """注册撤单事件"""
+        ts = time.monotonic_ns()
         cancel_event = PriorityEvent(
             priority=EventPriority.CANCEL,
             event_type="CANCEL",
             order_id=order_id,
-            data={'timestamp': time.time()},
-            timestamp=time.time(),
+            data={'timestamp': ts},
+            timestamp=ts,
             callback=callback
         )
         
         self.add_priority_event(cancel_event)
         
-        logger.debug(
-            "[MillisecondResponse] 🚫 CANCEL事件注册: %s (优先级=2)",
-            order_id
-        )
+        if self._log_debug:
+            logger.debug(
+                "[MillisecondResponse] 🚫 CANCEL事件注册: %s (优先级=2)",
+                order_id
+            )
     
     def register_replace_event(self, order_id: str, new_price: Decimal, 
                              new_qty: Decimal, callback: Callable):
         """注册改单事件"""
+        ts = time.monotonic_ns()
         replace_event = PriorityEvent(
             priority=EventPriority.REPLACE,
             event_type="REPLACE",
@@ -176,22 +221,24 @@ class MillisecondResponseSystem:
             data={
                 'new_price': new_price,
                 'new_qty': new_qty,
-                'timestamp': time.time()
+                'timestamp': ts
             },
-            timestamp=time.time(),
+            timestamp=ts,
             callback=callback
         )
         
         self.add_priority_event(replace_event)
         
-        logger.debug(
-            "[MillisecondResponse] 🔄 REPLACE事件注册: %s %s@%s (优先级=3)",
-            order_id, new_qty, new_price
-        )
+        if self._log_debug:
+            logger.debug(
+                "[MillisecondResponse] 🔄 REPLACE事件注册: %s %s@%s (优先级=3)",
+                order_id, new_qty, new_price
+            )
     
     def register_create_event(self, order_id: str, side: str, 
                             qty: Decimal, price: Decimal, level: OrderLevel, callback: Callable):
         """注册创建订单事件"""
+        ts = time.monotonic_ns()
         create_event = PriorityEvent(
             priority=EventPriority.CREATE,
             event_type="CREATE",
@@ -201,9 +248,9 @@ class MillisecondResponseSystem:
                 'qty': qty,
                 'price': price,
                 'level': level,
-                'timestamp': time.time()
+                'timestamp': ts
             },
-            timestamp=time.time(),
+            timestamp=ts,
             callback=callback
         )
         
@@ -211,104 +258,165 @@ class MillisecondResponseSystem:
         
         # 注册到TTL跟踪
         ttl = self._calculate_ttl(level)
+        expire_time = ts + int(ttl * 1e9)
         self.active_orders[order_id] = {
             'ttl': ttl,
-            'created_time': time.time(),
+            'created_time': ts,
+            'expire_time': expire_time,
             'level': level
         }
+        heapq.heappush(self._ttl_heap, (expire_time, order_id))
         
-        logger.debug(
-            "[MillisecondResponse] 📝 CREATE事件注册: %s %s %s@%s TTL=%.1fs (优先级=4)",
-            order_id, side, qty, price, ttl
-        )
+        if self._log_debug:
+            logger.debug(
+                "[MillisecondResponse] 📝 CREATE事件注册: %s %s %s@%s TTL=%.1fs (优先级=4)",
+                order_id, side, qty, price, ttl
+            )
+    
+    def set_ttl_config(self, ttl_config: TTLConfig):
+        """更新TTL配置并重建预采样表"""
+        self.ttl_config = ttl_config
+        self._build_ttl_tables()
+    
+    def _build_ttl_tables(self):
+        """按当前配置为L0/L1/L2预采样带抖动的TTL，下单时循环取用"""
+        cfg = self.ttl_config
+        uniform = random.uniform
+        n = _TTL_TABLE_SIZE
+        # L0: 1.8-2.5s + 抖动
+        self._ttl_table_l0 = [uniform(cfg.l0_min, cfg.l0_max) + uniform(cfg.jitter_min, cfg.jitter_max)
+                              for _ in range(n)]
+        # L1: 8s + 抖动
+        self._ttl_table_l1 = [cfg.l1_ttl + uniform(cfg.jitter_min, cfg.jitter_max) for _ in range(n)]
+        # L2: 20s + 抖动
+        self._ttl_table_l2 = [cfg.l2_ttl + uniform(cfg.jitter_min, cfg.jitter_max) for _ in range(n)]
     
     def _calculate_ttl(self, level: OrderLevel) -> float:
-        """计算动态TTL"""
-        import random
+        """计算动态TTL (从预采样表中循环取值)"""
+        self._ttl_cursor = idx = (self._ttl_cursor + 1) & _TTL_TABLE_MASK
         
         if level == OrderLevel.L0:
-            # L0: 1.8-2.5s + 抖动
-            base_ttl = random.uniform(self.ttl_config.l0_min, self.ttl_config.l0_max)
-            jitter = random.uniform(self.ttl_config.jitter_min, self.ttl_config.jitter_max)
-            return base_ttl + jitter
+            return self._ttl_table_l0[idx]
         elif level == OrderLevel.L1:
-            # L1: 8s + 抖动
-            jitter = random.uniform(self.ttl_config.jitter_min, self.ttl_config.jitter_max)
-            return self.ttl_config.l1_ttl + jitter
+            return self._ttl_table_l1[idx]
         else:  # L2
-            # L2: 20s + 抖动
-            jitter = random.uniform(self.ttl_config.jitter_min, self.ttl_config.jitter_max)
-            return self.ttl_config.l2_ttl + jitter
+            return self._ttl_table_l2[idx]
     
     async def process_priority_queue(self):
         """处理优先级队列 - 核心执行循环"""
+        resumed_from_idle = True  # 首批之前没有上一批，不记录间隔
         while self.running:
-            current_time = time.time()
+            current_time = time.monotonic_ns()  # 每轮只取一次时间戳
             
-            # 1. 检查微批间隔
-            if current_time - self.last_batch_time < self.micro_batch_interval:
-                await asyncio.sleep(0.001)  # 1ms短暂等待
+            # 1. 检查微批间隔 (直接睡到下一个批次窗口，不再1ms轮询)
+            remaining = self.last_batch_time + self.micro_batch_interval * 1e9 - current_time
+            if remaining > 0:
+                await asyncio.sleep(remaining / 1e9)
                 continue
             
             # 2. 处理TTL过期订单
             await self._check_ttl_violations(current_time)
             
-            # 3. 处理优先级队列中的事件
-            if self.priority_queue:
-                event = self.priority_queue.pop(0)  # 取出最高优先级事件
-                
-                try:
-                    # 执行事件回调
-                    if event.callback:
-                        start_time = time.time()
-                        await event.callback(event)
-                        execution_time = (time.time() - start_time) * 1000  # ms
-                        
-                        # 记录Fill→Repost延迟
-                        if event.event_type == "FILL":
-                            fill_to_repost_delay = (time.time() - event.timestamp) * 1000
-                            self.metrics.fill_to_repost_times.append(fill_to_repost_delay)
-                            self.repost_success_count += 1
-                            
-                            logger.info(
-                                "[MillisecondResponse] ⚡ FILL→REPOST: %s 延迟=%.1fms 执行=%.1fms",
-                                event.order_id, fill_to_repost_delay, execution_time
-                            )
-                        
-                        # 清理已处理的订单
-                        if event.event_type in ["CANCEL", "FILL"] and event.order_id in self.active_orders:
-                            del self.active_orders[event.order_id]
-                        
-                except Exception as e:
-                    logger.error(
-                        "[MillisecondResponse] 事件处理失败: %s %s - %s",
-                        event.event_type, event.order_id, str(e)
-                    )
+            # 3. 批量处理优先级队列中的事件 (每批按优先级封顶)
+            dispatched = 0
+            while True:
+                event = self._pop_priority_event()  # 取出最高优先级事件
+                if event is None:
+                    break
+                await self._dispatch_event(event)
+                # 出队本身不会倒置；但低优先级回调await期间到达的FILL只能等它执行完
+                if event.priority is not EventPriority.FILL and self.priority_queues[0]:
+                    self.metrics.priority_inversions += 1
+                dispatched += 1
+                if dispatched >= _BATCH_MAX[event.priority.value - 1]:
+                    break
             
-            # 4. 记录微批间隔
-            batch_interval = current_time - self.last_batch_time
-            self.metrics.micro_batch_intervals.append(batch_interval * 1000)  # ms
+            # 4. 记录微批间隔 (空闲唤醒后的首批不计入，只统计连续批次的节奏)
+            if not resumed_from_idle:
+                batch_interval = current_time - self.last_batch_time
+                self.metrics.micro_batch_intervals.append(batch_interval / 1e6)  # ms
             self.last_batch_time = current_time
             
-            # 5. 短暂休眠保持微批节奏
-            await asyncio.sleep(0.001)  # 1ms基础间隔
+            # 5. 队列为空时挂起，等待新事件唤醒或下一个TTL到期
+            resumed_from_idle = not self.queued_events
+            if resumed_from_idle:
+                await self._wait_for_work()
     
-    async def _check_ttl_violations(self, current_time: float):
-        """检查TTL违规并触发撤单"""
-        expired_orders = []
+    async def _dispatch_event(self, event: PriorityEvent):
+        """执行单个事件回调并记录指标"""
+        try:
+            # 执行事件回调
+            if event.callback:
+                start_time = time.monotonic_ns()
+                await event.callback(event)
+                end_time = time.monotonic_ns()
+                execution_time = (end_time - start_time) / 1e6  # ms
+                
+                # 记录Fill→Repost延迟
+                if event.event_type == "FILL":
+                    fill_to_repost_delay = (end_time - event.timestamp) / 1e6  # ms
+                    self._record_fill_latency(fill_to_repost_delay)
+                    self.repost_success_count += 1
+                    
+                    if self._log_info:
+                        logger.info(
+                            "[MillisecondResponse] ⚡ FILL→REPOST: %s 延迟=%.1fms 执行=%.1fms",
+                            event.order_id, fill_to_repost_delay, execution_time
+                        )
+                
+                # 清理已处理的订单
+                if event.event_type in ["CANCEL", "FILL"] and event.order_id in self.active_orders:
+                    del self.active_orders[event.order_id]
+                
+        except Exception as e:
+            logger.error(
+                "[MillisecondResponse] 事件处理失败: %s %s - %s",
+                event.event_type, event.order_id, str(e)
+            )
+    
+    async def _wait_for_work(self):
+        """空闲等待: 新事件到达立即唤醒；有TTL跟踪时最迟在最早到期时刻醒来"""
+        self._wakeup.clear()
+        if self.queued_events or not self.running:
+            return
         
-        for order_id, order_info in self.active_orders.items():
-            age = current_time - order_info['created_time']
-            if age > order_info['ttl']:
-                expired_orders.append(order_id)
-                self.metrics.ttl_violations += 1
+        timeout = None
+        if self._ttl_heap:
+            timeout = max(0.0, (self._ttl_heap[0][0] - time.monotonic_ns()) / 1e9)
         
-        # 处理过期订单（撤单）
-        for order_id in expired_orders:
-            order_info = self.active_orders[order_id]
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    def _record_fill_latency(self, delay_ms: float):
+        """记录Fill→Repost延迟，同步维护有序窗口 (二分插入/删除)"""
+        samples = self.metrics.fill_to_repost_times
+        sorted_samples = self._sorted_fill_times
+        if len(samples) == samples.maxlen:
+            # 窗口已满: 最旧样本即将被挤出，从有序副本中同步删除
+            del sorted_samples[bisect.bisect_left(sorted_samples, samples[0])]
+        samples.append(delay_ms)
+        bisect.insort(sorted_samples, delay_ms)
+    
+    async def _check_ttl_violations(self, current_time: int):
+        """检查TTL违规并触发撤单 (current_time为monotonic纳秒)"""
+        # 只弹出已到期的堆顶，代价与过期订单数成正比，而非全部活跃订单
+        ttl_heap = self._ttl_heap
+        while ttl_heap and ttl_heap[0][0] < current_time:
+            expire_time, order_id = heapq.heappop(ttl_heap)
+            
+            # 已成交/撤单，或同ID重新注册过的旧条目，直接丢弃
+            order_info = self.active_orders.get(order_id)
+            if order_info is None or order_info['expire_time'] != expire_time:
+                continue
+            
+            self.metrics.ttl_violations += 1
+            
+            # 处理过期订单（撤单）
             logger.warning(
                 "[MillisecondResponse] 🕒 TTL过期: %s 存活=%.1fs TTL=%.1fs Level=%s",
-                order_id, current_time - order_info['created_time'], 
+                order_id, (current_time - order_info['created_time']) / 1e9, 
                 order_info['ttl'], order_info['level'].value
             )
             
@@ -317,47 +425,61 @@ class MillisecondResponseSystem:
     
     async def _handle_ttl_cancel(self, event: PriorityEvent):
         """处理TTL触发的撤单"""
-        order_id = event.order_id
-        logger.info(
-            "[MillisecondResponse] 🚫 执行TTL撤单: %s",
-            order_id
-        )
+        if self._log_info:
+            logger.info(
+                "[MillisecondResponse] 🚫 执行TTL撤单: %s",
+                event.order_id
+            )
         # 实际撤单逻辑将由调用方提供
         return True
     
     def get_response_metrics(self) -> Dict[str, Any]:
         """获取毫秒响应系统指标"""
-        fill_times = self.metrics.fill_to_repost_times
+        # 有序窗口已增量维护，p50/p95/p99直接按下标读取
+        fill_times = self._sorted_fill_times
         queue_sizes = self.metrics.event_queue_sizes
         batch_intervals = self.metrics.micro_batch_intervals
+        n_fills = len(fill_times)
         
         return {
-            'fill_to_repost_p50': statistics.median(fill_times) if fill_times else 0.0,
-            'fill_to_repost_p95': self._percentile(fill_times, 95) if len(fill_times) > 20 else 0.0,
-            'fill_to_repost_p99': self._percentile(fill_times, 99) if len(fill_times) > 100 else 0.0,
-            'avg_queue_size': statistics.mean(queue_sizes) if queue_sizes else 0.0,
+            'fill_to_repost_p50': self._median(fill_times) if fill_times else 0.0,
+            'fill_to_repost_p95': self._percentile(fill_times, 95) if n_fills > 20 else 0.0,
+            'fill_to_repost_p99': self._percentile(fill_times, 99) if n_fills > 100 else 0.0,
+            'avg_queue_size': sum(queue_sizes) / len(queue_sizes) if queue_sizes else 0.0,
             'max_queue_size': max(queue_sizes) if queue_sizes else 0,
+            'queue_depth_max': {p.name: self.queue_depth_max[p.value - 1] for p in EventPriority},
             'ttl_violations': self.metrics.ttl_violations,
             'priority_inversions': self.metrics.priority_inversions,
             'fill_events': self.fill_events_count,
             'repost_success': self.repost_success_count,
             'success_rate': (self.repost_success_count / max(self.fill_events_count, 1)) * 100,
-            'avg_batch_interval': statistics.mean(batch_intervals) if batch_intervals else 0.0,
+            'avg_batch_interval': sum(batch_intervals) / len(batch_intervals) if batch_intervals else 0.0,
             'active_orders': len(self.active_orders)
         }
     
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """计算百分位数"""
-        if not data:
+    @staticmethod
+    def _median(sorted_data: List[float]) -> float:
+        """有序数据的中位数 (与statistics.median一致)"""
+        n = len(sorted_data)
+        mid = n // 2
+        if n % 2:
+            return sorted_data[mid]
+        return (sorted_data[mid - 1] + sorted_data[mid]) / 2
+    
+    @staticmethod
+    def _percentile(sorted_data: List[float], percentile: int) -> float:
+        """计算百分位数 (输入须已排序)"""
+        if not sorted_data:
             return 0.0
-        sorted_data = sorted(data)
         index = int((percentile / 100.0) * len(sorted_data))
         return sorted_data[min(index, len(sorted_data) - 1)]
     
     async def start(self):
         """启动毫秒响应系统"""
         self.running = True
-        self.last_batch_time = time.time()
+        self.last_batch_time = time.monotonic_ns()
+        self._wakeup = asyncio.Event()
+        self.refresh_log_flags()
         logger.info("[MillisecondResponse] 🚀 毫秒响应系统启动")
         
         # 启动优先级队列处理循环
@@ -366,6 +488,8 @@ class MillisecondResponseSystem:
     async def stop(self):
         """停止毫秒响应系统"""
         self.running = False
+        if self._wakeup is not None:
+            self._wakeup.set()  # 唤醒空闲等待中的处理循环以便退出
         logger.info("[MillisecondResponse] ⛔ 毫秒响应系统停止")
 
 
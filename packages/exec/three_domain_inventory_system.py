@@ -13,9 +13,10 @@ import asyncio
 import logging
 from decimal import Decimal
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Callable, Tuple
+from typing import Dict, List, Optional, Any, Callable, Tuple, Deque
 from enum import Enum
 import statistics
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -73,7 +74,7 @@ class MillisecondDomain:
     """毫秒级：FILL触发瞬时补位"""
     
     def __init__(self):
-        self.fill_response_history: List[float] = []  # 响应时间历史
+        self.fill_response_history: Deque[float] = deque(maxlen=100)  # 响应时间历史 (最近100个)
         self.instant_repost_enabled = True
         
         # 补位配置
@@ -162,8 +163,6 @@ class MillisecondDomain:
             # 记录响应时间
             response_time = (time.time() - start_time) * 1000  # ms
             self.fill_response_history.append(response_time)
-            if len(self.fill_response_history) > 100:
-                self.fill_response_history.pop(0)
             
             logger.debug(
                 "[MillisecondDomain] ⚡ 瞬时补位: %s %s@%s -> %d个补位订单 响应=%.1fms",
@@ -279,7 +278,7 @@ class MinuteDomain:
         self.aggressive_maker_factor = 1.5  # 紧急时提高maker积极性
         
         # 历史记录
-        self.twap_history: List[Dict] = []
+        self.twap_history: Deque[Dict] = deque(maxlen=100)  # 最近100次TWAP记录
         self.pov_usage: List[float] = []
         
         logger.info("[MinuteDomain] 分钟级TWAP/POV系统初始化完成")
@@ -363,8 +362,6 @@ class MinuteDomain:
                 'total_qty': float(rebalance_qty),
                 'emergency_level': emergency_level.value
             })
-            if len(self.twap_history) > 100:
-                self.twap_history.pop(0)
             
             if actions:
                 logger.info(
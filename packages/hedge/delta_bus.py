@@ -63,6 +63,9 @@ class DeltaBus:
         
         # 订阅者列表
         self.subscribers: List[Callable[[DeltaEvent], None]] = []
+        # 回调 -> 是否协程函数，订阅时判定一次，分发时不再逐事件检查
+        # (以subscribers为准；直接改动该列表的回调在首次分发时补判定)
+        self._subscriber_is_async: Dict[Callable[[DeltaEvent], None], bool] = {}
         
         # 统计信息
         self.stats = {
@@ -186,7 +189,7 @@ class DeltaBus:
             if self.latency_samples:
                 self.stats['avg_latency_ms'] = sum(self.latency_samples) / len(self.latency_samples)
             
-            logger.debug(f"[DeltaBus] 发布事件: {event.event_type.value} delta={event.delta_change:.2f}")
+            logger.debug("[DeltaBus] 发布事件: %s delta=%.2f", event.event_type.value, event.delta_change)
             return True
             
         except Exception as e:
@@ -202,6 +205,7 @@ class DeltaBus:
         """
         if callback not in self.subscribers:
             self.subscribers.append(callback)
+            self._subscriber_is_async[callback] = asyncio.iscoroutinefunction(callback)
             logger.info(f"[DeltaBus] 新增订阅者，当前订阅数: {len(self.subscribers)}")
     
     def unsubscribe(self, callback: Callable[[DeltaEvent], None]) -> None:
@@ -213,6 +217,7 @@ class DeltaBus:
         """
         if callback in self.subscribers:
             self.subscribers.remove(callback)
+            self._subscriber_is_async.pop(callback, None)
             logger.info(f"[DeltaBus] 移除订阅者，当前订阅数: {len(self.subscribers)}")
     
     async def _process_events(self) -> None:
@@ -231,12 +236,18 @@ class DeltaBus:
                 
                 # 处理批次
                 if batch:
+                    subscriber_is_async = self._subscriber_is_async
                     for event in batch:
                         # 通知所有订阅者
                         for subscriber in self.subscribers:
                             try:
+                                is_async = subscriber_is_async.get(subscriber)
+                                if is_async is None:
+                                    is_async = subscriber_is_async[subscriber] = \
+                                        asyncio.iscoroutinefunction(subscriber)
+                                
                                 # 如果是协程，await它
-                                if asyncio.iscoroutinefunction(subscriber):
+                                if is_async:
                                     await subscriber(event)
                                 else:
                                     subscriber(event)
@@ -245,7 +256,7 @@ class DeltaBus:
                         
                         self.stats['events_processed'] += 1
                     
-                    logger.debug(f"[DeltaBus] 处理批次: {len(batch)}个事件")
+                    logger.debug("[DeltaBus] 处理批次: %d个事件", len(batch))
                 
                 # 短暂休眠
                 await asyncio.sleep(0.001)  # 1ms
@@ -158,7 +158,7 @@ class HedgeGovernor:
         
         # 检查黑名单
         if self._is_blacklisted(budget_type):
-            logger.warning(f"[HedgeGovernor] {budget_type.value}在黑名单中")
+            logger.warning("[HedgeGovernor] %s在黑名单中", budget_type.value)
             self.stats['rejected_requests'] += 1
             return None
         
@@ -177,7 +177,7 @@ class HedgeGovernor:
         elif current_usage < burst_limit:
             # Burst额度
             available = burst_limit - current_usage
-            logger.debug(f"[HedgeGovernor] 使用burst额度: {budget_type.value}")
+            logger.debug("[HedgeGovernor] 使用burst额度: %s", budget_type.value)
         else:
             # 无额度
             available = 0
@@ -190,8 +190,8 @@ class HedgeGovernor:
             gate_level = self._check_gate_level(budget_type, current_usage, budget_limit)
             self._handle_gate_trigger(gate_level, budget_type)
             
-            logger.warning(f"[HedgeGovernor] 额度不足: {budget_type.value} "
-                          f"requested={tokens}, available={available}")
+            logger.warning("[HedgeGovernor] 额度不足: %s requested=%s, available=%s",
+                           budget_type.value, tokens, available)
             return None
         
         # 分配租约
@@ -203,7 +203,7 @@ class HedgeGovernor:
         
         self.stats['approved_requests'] += 1
         
-        logger.debug(f"[HedgeGovernor] 租约批准: {lease_id} {budget_type.value} tokens={tokens}")
+        logger.debug("[HedgeGovernor] 租约批准: %s %s tokens=%s", lease_id, budget_type.value, tokens)
         
         return lease_id
     
@@ -218,13 +218,13 @@ class HedgeGovernor:
             是否成功
         """
         if lease_id not in self.active_leases:
-            logger.warning(f"[HedgeGovernor] 租约不存在: {lease_id}")
+            logger.warning("[HedgeGovernor] 租约不存在: %s", lease_id)
             return False
         
         # 移除租约（已使用）
         del self.active_leases[lease_id]
         
-        logger.debug(f"[HedgeGovernor] 租约提交: {lease_id}")
+        logger.debug("[HedgeGovernor] 租约提交: %s", lease_id)
         return True
     
     def rollback_lease(self, lease_id: str) -> bool:
@@ -238,7 +238,7 @@ class HedgeGovernor:
             是否成功
         """
         if lease_id not in self.active_leases:
-            logger.warning(f"[HedgeGovernor] 租约不存在: {lease_id}")
+            logger.warning("[HedgeGovernor] 租约不存在: %s", lease_id)
             return False
         
         budget_type, tokens, _ = self.active_leases[lease_id]
@@ -249,7 +249,7 @@ class HedgeGovernor:
         
         self.stats['lease_rollbacks'] += 1
         
-        logger.info(f"[HedgeGovernor] 租约回滚: {lease_id} {budget_type.value} tokens={tokens}")
+        logger.info("[HedgeGovernor] 租约回滚: %s %s tokens=%s", lease_id, budget_type.value, tokens)
         return True
     
     def set_dynamic_budgets(self, fill: Optional[int] = None, 
@@ -311,8 +311,8 @@ class HedgeGovernor:
         # 更新状态
         self.last_error = error
         
-        logger.debug(f"[HedgeGovernor] PID调整: usage={current_usage_pct:.3f}, "
-                    f"error={error:.3f}, adjustment={adjustment:.3f}")
+        logger.debug("[HedgeGovernor] PID调整: usage=%.3f, error=%.3f, adjustment=%.3f",
+                     current_usage_pct, error, adjustment)
     
     def _update_window(self) -> None:
         """
@@ -373,15 +373,15 @@ class HedgeGovernor:
         self.stats['gate_triggers'][gate_level] += 1
         
         if gate_level == GateLevel.SOFT:
-            logger.debug(f"[HedgeGovernor] 软闸触发: {budget_type.value}")
+            logger.debug("[HedgeGovernor] 软闸触发: %s", budget_type.value)
         elif gate_level == GateLevel.MEDIUM:
-            logger.info(f"[HedgeGovernor] 中等闸门触发: {budget_type.value}")
+            logger.info("[HedgeGovernor] 中等闸门触发: %s", budget_type.value)
         elif gate_level == GateLevel.HARD:
-            logger.warning(f"[HedgeGovernor] 硬闸触发: {budget_type.value}")
+            logger.warning("[HedgeGovernor] 硬闸触发: %s", budget_type.value)
             # 临时限制
             self.blacklist[budget_type] = time.time() + 1.0  # 1秒黑名单
         else:  # EMERGENCY
-            logger.error(f"[HedgeGovernor] 紧急闸门触发: {budget_type.value}")
+            logger.error("[HedgeGovernor] 紧急闸门触发: %s", budget_type.value)
             # 长时间限制
             self.blacklist[budget_type] = time.time() + 10.0  # 10秒黑名单
     
@@ -66,6 +66,7 @@ class BudgetGovernor:
         self.ema_usage = None  # usage EMA
         self.prev = None       # 上次预算（用于限幅）
         self.history = deque(maxlen=60)  # 保留60s历史用于分析
+        self._h2_tracking_errors = deque(maxlen=600)  # H2: usage跟踪平方误差 (1分钟采样)
         
         logger.info(f"[GOV] BudgetGovernor初始化: target={usage_target_pct}%, safe={usage_safe_pct}%, "
                    f"budgets=[{min_budgets[0]}-{max_budgets[0]}, {min_budgets[1]}-{max_budgets[1]}, {min_budgets[2]}-{max_budgets[2]}]")
@@ -159,14 +160,12 @@ class BudgetGovernor:
             scale = min(scale, 0.8)
         
         # H2指标：记录tracking_error用于计算MSE
-        if not hasattr(self, '_h2_tracking_errors'):
-            self._h2_tracking_errors = deque(maxlen=600)  # 1分钟采样
         self._h2_tracking_errors.append(e * e)  # 平方误差
         
         # 每分钟计算一次MSE
         if len(self._h2_tracking_errors) >= 600:
             mse = sum(self._h2_tracking_errors) / len(self._h2_tracking_errors)
-            logger.info(f"[H2-PID] usage_tracking_mse={mse:.4f} target_range=[10,12]%")
+            logger.info("[H2-PID] usage_tracking_mse=%.4f target_range=[10,12]%%", mse)
             
         return self._clamp(scale, 0.5, 1.5)  # 扩大调整范围
 
@@ -251,8 +250,8 @@ class BudgetGovernor:
             burst_fill_sell = max(1, burst_fill_sell)
             
             # 日志输出双边预算
-            logger.info(f"[CQM] side_budget fill=buy/sell={fill_10s_buy}/{fill_10s_sell} "
-                       f"burst={burst_fill_buy}/{burst_fill_sell} inv_err={inv_err:.3f} α={alpha:.2f}")
+            logger.info("[CQM] side_budget fill=buy/sell=%s/%s burst=%s/%s inv_err=%.3f α=%.2f",
+                        fill_10s_buy, fill_10s_sell, burst_fill_buy, burst_fill_sell, inv_err, alpha)
 
             self.prev = (fill, rep, can)
             self.last_apply_ts = now_ts
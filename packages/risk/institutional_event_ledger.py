@@ -7,9 +7,9 @@ import asyncio
 import logging
 from decimal import Decimal
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Deque
 from threading import Lock
-from collections import defaultdict
+from collections import defaultdict, deque
 import hashlib
 import json
 
@@ -104,7 +104,7 @@ class DualPathReconciler:
         self.tolerance = tolerance  # 0.1%容差
         self.last_reconcile_ts = time.time()
         self.reconcile_count = 0
-        self.deviation_history: List[Dict[str, float]] = []
+        self.deviation_history: Deque[Dict[str, float]] = deque(maxlen=100)  # 保留最近100条记录
         
     async def verify_consistency(self):
         """验证一致性 - 异步执行避免阻塞主流程"""
@@ -133,16 +133,12 @@ class DualPathReconciler:
             base_dev * 100, quote_dev * 100, self.tolerance * 100
         )
         
-        # 记录偏差历史
+        # 记录偏差历史 (deque满时自动淘汰最旧记录)
         self.deviation_history.append({
             'ts': time.time(),
             'base_dev': base_dev,
             'quote_dev': quote_dev
         })
-        
-        # 保留最近100条记录
-        if len(self.deviation_history) > 100:
-            self.deviation_history.pop(0)
 
 
 class InstitutionalEventLedger:
@@ -2,10 +2,11 @@
 Pessimistic Reservation Model - 悲观预扣模型
 零-2010错误目标，对标机构级交易系统标准
 """
+import heapq
 import logging
 import time
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from threading import Lock
 from collections import defaultdict
 from dataclasses import dataclass
@@ -62,6 +63,9 @@ class PessimisticReservationModel:
         # 预扣记录 (按订单ID索引)
         self.reservations: Dict[str, ReservationRecord] = {}
         
+        # 到期最小堆 (expire_ts_ns, order_id)，TTL清理只弹出已到期条目
+        self._expiry_heap: List[Tuple[int, str]] = []
+        
         # 性能指标
         self.metrics = {
             'reservations_created': 0,
@@ -119,9 +123,11 @@ class PessimisticReservationModel:
                 asset, total_balance, reserved, pre_committed, available
             )
             
-            # 定期TTL清理
-            if time.time() - self.last_cleanup_ts > self.cleanup_interval:
-                self._cleanup_expired_reservations()
+            cleanup_due = time.time() - self.last_cleanup_ts > self.cleanup_interval
+        
+        # 定期TTL清理 (在锁外调用：清理自身会加锁，释放预扣也会加锁)
+        if cleanup_due:
+            self._cleanup_expired_reservations()
     
     def reserve(self, order_id: str, side: str, qty: Decimal, price: Decimal) -> bool:
         """别名：兼容旧接口"""
@@ -191,6 +197,7 @@ class PessimisticReservationModel:
                 )
                 
                 self.reservations[order_id] = reservation
+                heapq.heappush(self._expiry_heap, (self._expire_ts(reservation), order_id))
                 
                 # 更新资产状态 (减少可用余额)
                 new_available = balance.available - required
@@ -233,14 +240,20 @@ class PessimisticReservationModel:
         Returns:
             bool: 释放是否成功
         """
+        # 无锁快路径：重复回报时预扣早已释放，不必争锁
+        # (dict成员判断在GIL下是原子的；存在时仍在锁内重新确认)
+        if order_id not in self.reservations:
+            logger.debug(
+                "[PessimisticReservation] No reservation found for: %s",
+                order_id
+            )
+            return False
+        
         with self.lock:
             try:
                 reservation = self.reservations.get(order_id)
                 if not reservation:
-                    logger.debug(
-                        "[PessimisticReservation] No reservation found for: %s",
-                        order_id
-                    )
+                    # 快路径检查之后被并发释放(正常竞态)，未命中日志只在快路径记录
                     return False
                 
                 asset = reservation.asset
@@ -363,12 +376,20 @@ class PessimisticReservationModel:
         current_ts = time.time_ns()
         expired_orders = []
         
-        for order_id, record in self.reservations.items():
-            age_seconds = (current_ts - record.reserved_ts) / 1e9
-            if age_seconds > record.ttl_seconds:
+        # 只弹出已到期的堆顶，代价与过期数成正比，而非全部预扣
+        # (堆与预扣记录在锁内读取，与reserve_for_order的入堆互斥)
+        with self.lock:
+            expiry_heap = self._expiry_heap
+            while expiry_heap and expiry_heap[0][0] < current_ts:
+                expire_ts, order_id = heapq.heappop(expiry_heap)
+                
+                # 已释放，或同ID重新预扣过的旧条目，直接丢弃
+                record = self.reservations.get(order_id)
+                if record is None or self._expire_ts(record) != expire_ts:
+                    continue
                 expired_orders.append(order_id)
         
-        # 释放过期预扣
+        # 释放过期预扣 (release_reservation自行加锁，须在锁外调用)
         for order_id in expired_orders:
             logger.info(
                 "[PessimisticReservation] TTL cleanup: releasing expired reservation %s",
@@ -387,6 +408,11 @@ class PessimisticReservationModel:
         
         return len(expired_orders)
     
+    @staticmethod
+    def _expire_ts(record: ReservationRecord) -> int:
+        """预扣到期时间 (纳秒)"""
+        return record.reserved_ts + record.ttl_seconds * 1_000_000_000
+    
     def cleanup_expired_reservations(self) -> int:
         """
         公有方法：清理过期的预扣记录
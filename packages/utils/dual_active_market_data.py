@@ -6,11 +6,12 @@ import asyncio
 import time
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Deque
 from dataclasses import dataclass, field
 from enum import Enum
 import statistics
 import json
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +53,7 @@ class LatencyMonitor:
     
     def __init__(self, window_size: int = 100):
         self.window_size = window_size
-        self.latency_samples: Dict[str, List[int]] = {}
+        self.latency_samples: Dict[str, Deque[int]] = {}
         self.success_counts: Dict[str, int] = {}
         self.total_counts: Dict[str, int] = {}
         self.last_metrics: Dict[str, LatencyMetric] = {}
@@ -61,14 +62,12 @@ class LatencyMonitor:
         """记录延迟样本"""
         # 初始化源
         if source not in self.latency_samples:
-            self.latency_samples[source] = []
+            self.latency_samples[source] = deque(maxlen=self.window_size)
             self.success_counts[source] = 0
             self.total_counts[source] = 0
         
         # 记录延迟样本
         self.latency_samples[source].append(latency_ns)
-        if len(self.latency_samples[source]) > self.window_size:
-            self.latency_samples[source].pop(0)
         
         # 记录成功率
         self.total_counts[source] += 1
@@ -209,6 +208,8 @@ class DualActiveMarketData:
         
         # 数据回调
         self.ticker_callbacks: List[Callable[[TickerData], Any]] = []
+        # 回调 -> 是否协程函数，注册时判定 (以ticker_callbacks为准，缺失时在分发时补判定)
+        self._ticker_callback_is_async: Dict[Callable[[TickerData], Any], bool] = {}
         
         # 运行状态
         self.running = False
@@ -232,6 +233,7 @@ class DualActiveMarketData:
     def add_ticker_callback(self, callback: Callable[[TickerData], Any]):
         """添加ticker数据回调"""
         self.ticker_callbacks.append(callback)
+        self._ticker_callback_is_async[callback] = asyncio.iscoroutinefunction(callback)
         logger.debug("[DualActiveMarketData] Added ticker callback")
     
     async def start(self):
@@ -449,9 +451,14 @@ class DualActiveMarketData:
     
     async def _distribute_ticker(self, ticker: TickerData):
         """分发ticker数据到回调"""
+        callback_is_async = self._ticker_callback_is_async
         for callback in self.ticker_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
+                is_async = callback_is_async.get(callback)
+                if is_async is None:
+                    is_async = callback_is_async[callback] = asyncio.iscoroutinefunction(callback)
+                
+                if is_async:
                     await callback(ticker)
                 else:
                     callback(ticker)
@@ -18,6 +18,13 @@ import asyncio
 
 logger = logging.getLogger(__name__)
 
+# 比例钳制边界 (模块级常量，避免每tick重复构造Decimal)
+_SIDE_RATIO_MIN = Decimal('0.35')
+_SIDE_RATIO_MAX = Decimal('0.65')
+_L0_RATIO_MIN = Decimal('0.60')
+_L0_RATIO_MAX = Decimal('0.80')
+_DEVIATION_LIMIT = Decimal('0.3')
+
 
 class Side(Enum):
     """订单方向"""
@@ -65,6 +72,19 @@ class LiquiditySnapshot:
     spread_bps: float          # 当前价差(基点)
 
 
+@dataclass(frozen=True)
+class EnvelopeHealth:
+    """包络健康评估结果 (内部使用，导出时再转dict)"""
+    status: str
+    health_score: float
+    buy_l0_slots: int
+    sell_l0_slots: int
+    buy_notional_ratio: float
+    sell_notional_ratio: float
+    inventory_skew: Decimal
+    violations: int
+
+
 class LiquidityEnvelope:
     """
     流动性包络 - 机构级流动性管理系统
@@ -76,6 +96,10 @@ class LiquidityEnvelope:
     4. 零空档：实时监控并自动补单
     """
     
+    # 零空档违规载荷是常量，预构建模板，检测时浅拷贝即可
+    _ZERO_GAP_BUY = {'type': 'ZERO_GAP', 'side': 'BUY', 'severity': 'CRITICAL'}
+    _ZERO_GAP_SELL = {'type': 'ZERO_GAP', 'side': 'SELL', 'severity': 'CRITICAL'}
+    
     def __init__(self, 
                  alpha: float = 0.10,           # 权益配置比例 (10%)
                  min_l0_slots: int = 8,         # L0最小槽位数
@@ -94,6 +118,7 @@ class LiquidityEnvelope:
         self.min_l0_slots = min_l0_slots
         self.max_l0_slots = max_l0_slots
         self.spread_sensitivity = spread_sensitivity
+        self._alpha_dec = Decimal(str(alpha))  # alpha构造后不变，缓存Decimal形式
         
         # 层级配置
         self.layer_configs = {
@@ -149,7 +174,7 @@ class LiquidityEnvelope:
             inventory_skew = Decimal('0.0')
         
         # 计算目标配置
-        target_allocation = total_equity * Decimal(str(self.alpha))
+        target_allocation = total_equity * self._alpha_dec
         
         # 根据库存偏斜调整侧向配置
         # inventory_skew > 0: DOGE过多，减少SELL侧配置，增加BUY侧
@@ -161,8 +186,15 @@ class LiquidityEnvelope:
         sell_ratio = base_ratio + skew_adjustment # DOGE多时减少sell
         
         # 确保比例在合理范围内
-        buy_ratio = max(Decimal('0.35'), min(Decimal('0.65'), buy_ratio))
-        sell_ratio = max(Decimal('0.35'), min(Decimal('0.65'), sell_ratio))
+        # (成对min/max改为直接比较，省去内建函数调用)
+        if buy_ratio < _SIDE_RATIO_MIN:
+            buy_ratio = _SIDE_RATIO_MIN
+        elif buy_ratio > _SIDE_RATIO_MAX:
+            buy_ratio = _SIDE_RATIO_MAX
+        if sell_ratio < _SIDE_RATIO_MIN:
+            sell_ratio = _SIDE_RATIO_MIN
+        elif sell_ratio > _SIDE_RATIO_MAX:
+            sell_ratio = _SIDE_RATIO_MAX
         
         # 归一化
         total_ratio = buy_ratio + sell_ratio
@@ -170,12 +202,13 @@ class LiquidityEnvelope:
         sell_ratio /= total_ratio
         
         # 计算各侧目标
-        buy_target = target_allocation * Decimal(str(buy_ratio))
-        sell_target = target_allocation * Decimal(str(sell_ratio))
+        buy_target = target_allocation * buy_ratio
+        sell_target = target_allocation * sell_ratio
         
-        # 计算层级目标
-        buy_layers = self._calculate_layer_targets(buy_target, spread_bps)
-        sell_layers = self._calculate_layer_targets(sell_target, spread_bps)
+        # 计算层级目标 (两侧共用同一组层级比例，每tick只算一次)
+        layer_ratios = self._calculate_layer_ratios(spread_bps)
+        buy_layers = self._calculate_layer_targets(buy_target, layer_ratios)
+        sell_layers = self._calculate_layer_targets(sell_target, layer_ratios)
         
         # 创建侧向目标
         buy_side = SideTarget(
@@ -217,28 +250,32 @@ class LiquidityEnvelope:
         
         return snapshot
     
-    def _calculate_layer_targets(self, side_target: Decimal, spread_bps: float) -> Dict[OrderLevel, Decimal]:
-        """计算各层级目标"""
-        layer_targets = {}
-        
+    def _calculate_layer_ratios(self, spread_bps: float) -> Tuple[Decimal, Decimal, Decimal]:
+        """计算各层级分配比例 (L0, L1, L2)，和为1"""
         # 根据价差调整L0配置
         spread_factor = Decimal('1.0') + (Decimal(str(spread_bps)) - Decimal('10.0')) / Decimal('100.0')  # 基准10bps
-        l0_ratio = max(Decimal('0.60'), min(Decimal('0.80'), Decimal(str(self.layer_configs[OrderLevel.L0].allocation_ratio)) * spread_factor))
+        l0_ratio = Decimal(str(self.layer_configs[OrderLevel.L0].allocation_ratio)) * spread_factor
+        if l0_ratio < _L0_RATIO_MIN:
+            l0_ratio = _L0_RATIO_MIN
+        elif l0_ratio > _L0_RATIO_MAX:
+            l0_ratio = _L0_RATIO_MAX
         
         # 重新计算比例确保和为1
         l1_ratio = Decimal(str(self.layer_configs[OrderLevel.L1].allocation_ratio))
         l2_ratio = Decimal(str(self.layer_configs[OrderLevel.L2].allocation_ratio))
         
         total_ratio = l0_ratio + l1_ratio + l2_ratio
-        l0_ratio /= total_ratio
-        l1_ratio /= total_ratio
-        l2_ratio /= total_ratio
-        
-        layer_targets[OrderLevel.L0] = side_target * l0_ratio
-        layer_targets[OrderLevel.L1] = side_target * l1_ratio
-        layer_targets[OrderLevel.L2] = side_target * l2_ratio
-        
-        return layer_targets
+        return l0_ratio / total_ratio, l1_ratio / total_ratio, l2_ratio / total_ratio
+    
+    def _calculate_layer_targets(self, side_target: Decimal,
+                                 layer_ratios: Tuple[Decimal, Decimal, Decimal]) -> Dict[OrderLevel, Decimal]:
+        """计算各层级目标"""
+        l0_ratio, l1_ratio, l2_ratio = layer_ratios
+        return {
+            OrderLevel.L0: side_target * l0_ratio,
+            OrderLevel.L1: side_target * l1_ratio,
+            OrderLevel.L2: side_target * l2_ratio,
+        }
     
     def update_current_state(self, buy_orders: List[Dict], sell_orders: List[Dict]):
         """
@@ -325,44 +362,36 @@ class LiquidityEnvelope:
         
         # 检测零空档
         if snapshot.buy_side.l0_slots == 0:
-            violations.append({
-                'type': 'ZERO_GAP',
-                'side': 'BUY',
-                'severity': 'CRITICAL'
-            })
+            violations.append(self._ZERO_GAP_BUY.copy())
             self.metrics['gap_violations_detected'] += 1
         
         if snapshot.sell_side.l0_slots == 0:
-            violations.append({
-                'type': 'ZERO_GAP',
-                'side': 'SELL',
-                'severity': 'CRITICAL'
-            })
+            violations.append(self._ZERO_GAP_SELL.copy())
             self.metrics['gap_violations_detected'] += 1
         
-        # 检测名义额偏差
-        buy_deviation = abs(snapshot.buy_side.current_notional - snapshot.buy_side.target_notional)
-        buy_deviation_ratio = buy_deviation / snapshot.buy_side.target_notional if snapshot.buy_side.target_notional > 0 else 0
+        # 检测名义额偏差 (阈值乘到目标上比较，仅在触发时才做除法)
+        buy_target = snapshot.buy_side.target_notional
+        buy_deviation = abs(snapshot.buy_side.current_notional - buy_target)
         
-        if buy_deviation_ratio > Decimal('0.3'):  # 偏差超过30%
+        if buy_target > 0 and buy_deviation > buy_target * _DEVIATION_LIMIT:  # 偏差超过30%
             violations.append({
                 'type': 'NOTIONAL_DEVIATION',
                 'side': 'BUY',
                 'current': float(snapshot.buy_side.current_notional),
-                'target': float(snapshot.buy_side.target_notional),
-                'deviation_ratio': float(buy_deviation_ratio)
+                'target': float(buy_target),
+                'deviation_ratio': float(buy_deviation / buy_target)
             })
         
-        sell_deviation = abs(snapshot.sell_side.current_notional - snapshot.sell_side.target_notional)
-        sell_deviation_ratio = sell_deviation / snapshot.sell_side.target_notional if snapshot.sell_side.target_notional > 0 else 0
+        sell_target = snapshot.sell_side.target_notional
+        sell_deviation = abs(snapshot.sell_side.current_notional - sell_target)
         
-        if sell_deviation_ratio > Decimal('0.3'):  # 偏差超过30%
+        if sell_target > 0 and sell_deviation > sell_target * _DEVIATION_LIMIT:  # 偏差超过30%
             violations.append({
                 'type': 'NOTIONAL_DEVIATION',
                 'side': 'SELL',
                 'current': float(snapshot.sell_side.current_notional),
-                'target': float(snapshot.sell_side.target_notional),
-                'deviation_ratio': float(sell_deviation_ratio)
+                'target': float(sell_target),
+                'deviation_ratio': float(sell_deviation / sell_target)
             })
         
         if violations:
@@ -461,36 +490,40 @@ class LiquidityEnvelope:
         
         return orders
     
-    def get_envelope_health(self) -> Dict[str, any]:
-        """获取包络健康状态"""
+    def _assess_health(self) -> Optional[EnvelopeHealth]:
+        """评估包络健康状态，未初始化时返回None"""
         if not self.last_snapshot:
-            return {
-                'status': 'NOT_INITIALIZED',
-                'health_score': 0.0,
-                'metrics': self.metrics.copy()
-            }
+            return None
         
         snapshot = self.last_snapshot
+        buy_side = snapshot.buy_side
+        sell_side = snapshot.sell_side
         
         # 计算健康得分
         health_factors = []
         
         # L0槽位健康度
-        buy_l0_health = min(1.0, snapshot.buy_side.l0_slots / self.min_l0_slots)
-        sell_l0_health = min(1.0, snapshot.sell_side.l0_slots / self.min_l0_slots)
+        buy_l0_health = buy_side.l0_slots / self.min_l0_slots
+        sell_l0_health = sell_side.l0_slots / self.min_l0_slots
+        if buy_l0_health > 1.0:
+            buy_l0_health = 1.0
+        if sell_l0_health > 1.0:
+            sell_l0_health = 1.0
         health_factors.append((buy_l0_health + sell_l0_health) / 2.0)
         
-        # 名义额匹配度
-        if snapshot.buy_side.target_notional > 0:
-            buy_match = min(1.0, snapshot.buy_side.current_notional / snapshot.buy_side.target_notional)
-            health_factors.append(buy_match)
+        # 名义额匹配度 (比例只算一次，同时用于得分和导出)
+        buy_notional_ratio = 0.0
+        if buy_side.target_notional > 0:
+            buy_notional_ratio = float(buy_side.current_notional / buy_side.target_notional)
+            health_factors.append(buy_notional_ratio if buy_notional_ratio < 1.0 else 1.0)
         
-        if snapshot.sell_side.target_notional > 0:
-            sell_match = min(1.0, snapshot.sell_side.current_notional / snapshot.sell_side.target_notional)
-            health_factors.append(sell_match)
+        sell_notional_ratio = 0.0
+        if sell_side.target_notional > 0:
+            sell_notional_ratio = float(sell_side.current_notional / sell_side.target_notional)
+            health_factors.append(sell_notional_ratio if sell_notional_ratio < 1.0 else 1.0)
         
         # 综合健康得分
-        health_score = sum(health_factors) / len(health_factors) if health_factors else 0.0
+        health_score = sum(health_factors) / len(health_factors)
         
         # 状态判定
         if health_score >= 0.9:
@@ -500,31 +533,62 @@ class LiquidityEnvelope:
         else:
             status = 'CRITICAL'
         
+        return EnvelopeHealth(
+            status=status,
+            health_score=health_score,
+            buy_l0_slots=buy_side.l0_slots,
+            sell_l0_slots=sell_side.l0_slots,
+            buy_notional_ratio=buy_notional_ratio,
+            sell_notional_ratio=sell_notional_ratio,
+            inventory_skew=snapshot.inventory_skew,
+            violations=len(self.detect_violations())
+        )
+    
+    def get_envelope_health(self) -> Dict[str, any]:
+        """获取包络健康状态"""
+        health = self._assess_health()
+        if health is None:
+            return {
+                'status': 'NOT_INITIALIZED',
+                'health_score': 0.0,
+                'metrics': self.metrics.copy()
+            }
+        
         return {
-            'status': status,
-            'health_score': health_score,
-            'buy_l0_slots': snapshot.buy_side.l0_slots,
-            'sell_l0_slots': snapshot.sell_side.l0_slots,
+            'status': health.status,
+            'health_score': health.health_score,
+            'buy_l0_slots': health.buy_l0_slots,
+            'sell_l0_slots': health.sell_l0_slots,
             'buy_l0_target': self.min_l0_slots,
             'sell_l0_target': self.min_l0_slots,
-            'buy_notional_ratio': float(snapshot.buy_side.current_notional / snapshot.buy_side.target_notional) if snapshot.buy_side.target_notional > 0 else 0,
-            'sell_notional_ratio': float(snapshot.sell_side.current_notional / snapshot.sell_side.target_notional) if snapshot.sell_side.target_notional > 0 else 0,
-            'inventory_skew': snapshot.inventory_skew,
-            'violations': len(self.detect_violations()),
+            'buy_notional_ratio': health.buy_notional_ratio,
+            'sell_notional_ratio': health.sell_notional_ratio,
+            'inventory_skew': health.inventory_skew,
+            'violations': health.violations,
             'metrics': self.metrics.copy()
         }
     
     def get_health_metrics(self) -> Dict[str, any]:
-        """获取健康度指标 (get_envelope_health的别名)"""
-        health = self.get_envelope_health()
+        """获取健康度指标 (get_envelope_health的精简视图)"""
+        health = self._assess_health()
+        if health is None:
+            return {
+                'active_l0_slots': 0,
+                'min_l0_slots': self.min_l0_slots,
+                'target_achievement_rate': 0.0,
+                'status': 'NOT_INITIALIZED',
+                'violations': 0,
+                'buy_l0_slots': 0,
+                'sell_l0_slots': 0
+            }
         
-        # 转换为预期格式
+        # 直接读取结构体字段，不再经过中间dict
         return {
-            'active_l0_slots': health.get('buy_l0_slots', 0) + health.get('sell_l0_slots', 0),
+            'active_l0_slots': health.buy_l0_slots + health.sell_l0_slots,
             'min_l0_slots': self.min_l0_slots,
-            'target_achievement_rate': health.get('health_score', 0.0) * 100.0,
-            'status': health.get('status', 'UNKNOWN'),
-            'violations': health.get('violations', 0),
-            'buy_l0_slots': health.get('buy_l0_slots', 0),
-            'sell_l0_slots': health.get('sell_l0_slots', 0)
-        }
\ No newline at end of file
+            'target_achievement_rate': health.health_score * 100.0,
+            'status': health.status,
+            'violations': health.violations,
+            'buy_l0_slots': health.buy_l0_slots,
+            'sell_l0_slots': health.sell_l0_slots
+        }
@@ -52,6 +52,7 @@ class ObservabilityDashboard:
         self.current_metrics = SystemMetrics()
         self.alert_level = AlertLevel.GREEN
         self.alert_history = deque(maxlen=100)
+        self._latency_samples = deque(maxlen=100)  # 最近成交响应延迟样本 (ms)
         
         # 红线阈值配置
         self.thresholds = {
@@ -74,9 +75,6 @@ class ObservabilityDashboard:
 
     def update_fill_latency(self, latency_ms: float):
         """更新成交响应延迟指标"""
-        if not hasattr(self, '_latency_samples'):
-            self._latency_samples = deque(maxlen=100)
-        
         self._latency_samples.append(latency_ms)
         if len(self._latency_samples) >= 10:
             sorted_samples = sorted(self._latency_samples)
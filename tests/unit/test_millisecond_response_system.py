@@ -0,0 +1,72 @@
+import asyncio
+import dataclasses
+from decimal import Decimal
+
+import pytest
+
+from packages.exec.millisecond_response_system import (
+    MillisecondResponseSystem, OrderLevel, TTLConfig, _TTL_TABLE_SIZE
+)
+
+
+def test_restart_under_new_event_loop_keeps_dispatching():
+    system = MillisecondResponseSystem()
+    dispatched = []
+
+    async def on_fill(event):
+        dispatched.append(event.order_id)
+
+    async def run_once(order_id):
+        await system.start()
+        await asyncio.sleep(0.1)  # 首个微批之后处理循环进入空闲等待
+        system.register_fill_event(order_id, Decimal('0.25'), Decimal('100'), 'BUY', on_fill)
+        await asyncio.sleep(0.1)
+        await system.stop()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run_once('first'))
+    asyncio.run(run_once('second'))
+
+    assert dispatched == ['first', 'second']
+    assert system.queued_events == 0
+
+
+def test_fill_arriving_during_lower_priority_callback_counts_as_inversion():
+    system = MillisecondResponseSystem()
+
+    async def on_fill(event):
+        pass
+
+    async def on_cancel(event):
+        system.register_fill_event('fill', Decimal('0.25'), Decimal('100'), 'BUY', on_fill)
+
+    async def run():
+        await system.start()
+        system.register_cancel_event('cancel', on_cancel)
+        await asyncio.sleep(0.1)
+        await system.stop()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(run())
+
+    metrics = system.get_response_metrics()
+    assert metrics['priority_inversions'] == 1
+    assert metrics['repost_success'] == 1
+
+
+def test_set_ttl_config_rebuilds_presampled_tables():
+    system = MillisecondResponseSystem()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        system.ttl_config.l0_min = 1.0
+
+    config = TTLConfig(l0_min=3.0, l0_max=3.5, l1_ttl=12.0, l2_ttl=30.0,
+                       jitter_min=0.1, jitter_max=0.2)
+    system.set_ttl_config(config)
+
+    assert system.ttl_config is config
+    for table in (system._ttl_table_l0, system._ttl_table_l1, system._ttl_table_l2):
+        assert len(table) == _TTL_TABLE_SIZE
+    assert all(3.1 <= ttl <= 3.7 for ttl in system._ttl_table_l0)
+    assert all(12.1 <= ttl <= 12.2 for ttl in system._ttl_table_l1)
+    assert all(30.1 <= ttl <= 30.2 for ttl in system._ttl_table_l2)
+    assert 30.1 <= system._calculate_ttl(OrderLevel.L2) <= 30.2